@@ -18,6 +18,8 @@ data = [
 df = pd.DataFrame(data, columns=["date", "product", "quantity", "price"])
 df["date"] = pd.to_datetime(df["date"])
 # salva como Excel (.xlsx)
+# xlsxwriter escreve as linhas direto no zip, sem montar o DOM em memória
+# que o openpyxl usa — mais rápido e com menos alocações
 out = r"c:\Users\Usuario\Projetos Python\excel_to_pdf\sample_sales.xlsx"
-df.to_excel(out, index=False, engine="openpyxl")
+df.to_excel(out, index=False, engine="xlsxwriter")
 print(f"Arquivo de exemplo criado: {out}")
\ No newline at end of file
@@ -8,84 +8,209 @@ Descrição:
 
 Uso:
 python sales_report.py caminho/para/vendas.xlsx caminho/para/relatorio.pdf
+python sales_report.py diretorio/com/planilhas/ diretorio/de/saida/
 """
 import sys
 import io
+import os
+import re
+import glob
+import functools
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import tempfile
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.units import mm
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Image,
-    Table,
-    TableStyle,
-)
-from reportlab.lib.styles import getSampleStyleSheet
+
+# matplotlib e reportlab são importados dentro das funções que os usam:
+# importar matplotlib custa centenas de ms e não é necessário para quem
+# só quer read_sales_excel/summarize_*
 
 # -----------------------------
 # Funções de processamento
 # -----------------------------
 
+# classifica colunas num único passe; a ordem das alternativas importa
+# ('valor_unit' precisa casar como preço antes de 'valor' casar como venda)
+_COL_PAT = re.compile(
+    r'(?P<date>date|data)'
+    r'|(?P<qty>qty|quantity|quantidade)'
+    r'|(?P<price>price|preco|valor_unit)'
+    r'|(?P<prod>product|produto|item)'
+    r'|(?P<sales>sales|valor)'
+)
+
+def _classify_columns(columns):
+    """
+    Mapeia cada papel ('date', 'qty', 'price', 'prod', 'sales') para a
+    primeira coluna cujo nome casa com o padrão correspondente.
+    """
+    roles = {}
+    for c in columns:
+        m = _COL_PAT.search(c)
+        if m and m.lastgroup not in roles:
+            roles[m.lastgroup] = c
+    return roles
+
+def _cache_dataframe(func):
+    """
+    Decorator que guarda o DataFrame retornado num sidecar .parquet.
+    Enquanto o mtime do arquivo fonte não mudar, releituras carregam o
+    parquet (leitura colunar, ordens de grandeza mais rápida que o xlsx).
+    """
+    @functools.wraps(func)
+    def wrapper(path):
+        cache_path = f"{path}.cache.parquet"
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+                return pd.read_parquet(cache_path)
+        except Exception:
+            # cache inexistente, corrompido ou ilegível (pyarrow levanta
+            # ArrowInvalid em arquivo truncado): segue para a leitura normal
+            pass
+        df = func(path)
+        tmp_path = f"{cache_path}.tmp"
+        try:
+            # escrita atômica: um processo morto no meio do to_parquet não
+            # pode deixar um sidecar truncado com mtime mais novo que a fonte
+            df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            # cache é melhor-esforço: sem pyarrow, diretório somente-leitura
+            # ou coluna não serializável em parquet (ArrowTypeError em coluna
+            # object com tipos mistos) — nada disso pode falhar a leitura
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return df
+    return wrapper
+
+def _read_excel_openpyxl(path):
+    """
+    Leitura de fallback sem calamine. O modo read_only do openpyxl gera as
+    células sob demanda em vez de alocar um objeto Cell por célula; montar o
+    DataFrame de uma vez a partir das colunas evita ainda o passe de
+    metadados do pd.read_excel.
+    """
+    import openpyxl
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        # células de cabeçalho vazias ganham nome sintético e nomes repetidos
+        # recebem sufixo, como o pd.read_excel faria ('Unnamed: N' / 'col.1');
+        # sem isso o dict abaixo colapsaria colunas duplicadas
+        names = []
+        seen = {}
+        for i, h in enumerate(header):
+            name = str(h) if h is not None else f"unnamed_{i}"
+            count = seen.get(name, 0)
+            seen[name] = count + 1
+            if count:
+                name = f"{name}.{count}"
+            names.append(name)
+        cols = list(zip(*rows))
+        if not cols:
+            return pd.DataFrame(columns=names)
+        return pd.DataFrame({h: list(c) for h, c in zip(names, cols)})
+    finally:
+        wb.close()
+
+@_cache_dataframe
 def read_sales_excel(path):
     """
     Lê a planilha Excel em path e retorna um DataFrame.
     Tenta converter a coluna de data para datetime.
     """
-    # pandas usa openpyxl como engine para .xlsx
-    df = pd.read_excel(path, engine="openpyxl")
+    # calamine (Rust) faz parse do XML em streaming, bem mais rápido que openpyxl
+    # em arquivos grandes; se não estiver instalado, cai para openpyxl
+    try:
+        df = pd.read_excel(path, engine="calamine")
+    except ImportError:
+        df = _read_excel_openpyxl(path)
     # normaliza nomes de colunas para minúsculas
     df.columns = [c.strip().lower() for c in df.columns]
 
+    # classifica todas as colunas num único passe de regex
+    roles = _classify_columns(df.columns)
+
     # assegura que exista coluna de data
-    date_cols = [c for c in df.columns if "date" in c or "data" in c]
-    if date_cols:
-        df['date'] = pd.to_datetime(df[date_cols[0]])
+    if 'date' in roles:
+        df['date'] = pd.to_datetime(df[roles['date']])
     else:
         raise ValueError("Não foi encontrada coluna de data (nome contendo 'date' ou 'data').")
 
     # detecta vendas (sales) ou calcula a partir de quantidade*preço
-    if 'sales' in df.columns or 'valor' in df.columns:
-        sales_col = 'sales' if 'sales' in df.columns else 'valor'
-        df['sales'] = pd.to_numeric(df[sales_col], errors='coerce').fillna(0)
+    # float32 dá ~7 dígitos de precisão — sobra para valores monetários com
+    # 2 casas — e corta pela metade a banda de memória da agregação
+    if 'sales' in roles:
+        df['sales'] = pd.to_numeric(df[roles['sales']], errors='coerce').fillna(0).astype(np.float32)
+    elif 'qty' in roles and 'price' in roles:
+        df['quantity'] = pd.to_numeric(df[roles['qty']], errors='coerce').fillna(0).astype(np.float32)
+        df['price'] = pd.to_numeric(df[roles['price']], errors='coerce').fillna(0).astype(np.float32)
+        # multiplica direto sobre os arrays numpy contíguos, escrevendo num
+        # buffer pré-alocado — sem Series temporária no caminho quente
+        q = df['quantity'].to_numpy(dtype=np.float32, copy=False)
+        p = df['price'].to_numpy(dtype=np.float32, copy=False)
+        out = np.empty(len(q), dtype=np.float32)
+        np.multiply(q, p, out=out)
+        df['sales'] = out
     else:
-        # procura quantity/quantity-like e price/price-like
-        qty_cols = [c for c in df.columns if 'qty' in c or 'quantity' in c or 'quantidade' in c]
-        price_cols = [c for c in df.columns if 'price' in c or 'preco' in c or 'valor_unit' in c]
-        if qty_cols and price_cols:
-            df['quantity'] = pd.to_numeric(df[qty_cols[0]], errors='coerce').fillna(0)
-            df['price'] = pd.to_numeric(df[price_cols[0]], errors='coerce').fillna(0)
-            df['sales'] = df['quantity'] * df['price']
+        # se não conseguir calcular, tenta usar uma coluna chamada 'amount' ou similar
+        other = [c for c in df.columns if c in ('amount', 'valor_total', 'total')]
+        if other:
+            df['sales'] = pd.to_numeric(df[other[0]], errors='coerce').fillna(0).astype(np.float32)
         else:
-            # se não conseguir calcular, tenta usar uma coluna chamada 'amount' ou similar
-            other = [c for c in df.columns if c in ('amount','valor_total','total')]
-            if other:
-                df['sales'] = pd.to_numeric(df[other[0]], errors='coerce').fillna(0)
-            else:
-                raise ValueError("Não foi possível identificar colunas de vendas. Espere 'sales' ou 'quantity'+'price'.")
+            raise ValueError("Não foi possível identificar colunas de vendas. Espere 'sales' ou 'quantity'+'price'.")
 
     # assegura coluna product
-    prod_cols = [c for c in df.columns if 'product' in c or 'produto' in c or 'item' in c]
-    if prod_cols:
-        df['product'] = df[prod_cols[0]].astype(str)
+    if 'prod' in roles:
+        # category troca o hashing de PyObject por códigos inteiros no
+        # groupby (fastpath em Cython) e reduz memória em catálogos grandes;
+        # células vazias ganham rótulo explícito para não sumirem dos resumos
+        # nem quebrarem a plotagem com NaN
+        df['product'] = (
+            df[roles['prod']].astype('string').fillna('(sem produto)').astype('category')
+        )
     else:
         raise ValueError("Não foi encontrada coluna de produto (nome contendo 'product' ou 'produto').")
 
     return df
 
+def summarize_sales(df):
+    """
+    Calcula os dois resumos (por produto e por mês) num único groupby
+    sobre (product, month), reduzindo depois ao longo de cada nível.
+    Evita varrer o frame e montar a tabela hash de grupos duas vezes.
+    Retorna (df_products, df_monthly) nos mesmos formatos de
+    summarize_by_product e summarize_by_month.
+    """
+    # cast numpy direto para o piso do mês, sem criar objetos Period
+    df['month'] = df['date'].values.astype('datetime64[M]').astype('datetime64[ns]')
+    # sort=False pula a ordenação das chaves durante a agregação; a ordem
+    # final é imposta uma única vez pelos sort_values abaixo
+    g = df.groupby(['product', 'month'], dropna=False, sort=False, observed=True)['sales'].sum()
+    df_products = (
+        g.groupby(level=0, dropna=False, sort=False, observed=True).sum()
+        .sort_values(ascending=False).reset_index()
+    )
+    df_monthly = (
+        g.groupby(level=1, sort=False).sum().reset_index().sort_values('month')
+    )
+    return df_products, df_monthly
+
 def summarize_by_product(df):
     """
     Agrupa por produto e soma vendas.
     Retorna DataFrame ordenado decrescentemente por vendas.
     """
-    grp = df.groupby('product', dropna=False)['sales'].sum().reset_index()
+    # sort=False evita ordenar as chaves na agregação; o resultado já é
+    # reordenado por vendas logo abaixo
+    grp = df.groupby('product', dropna=False, sort=False, observed=True)['sales'].sum().reset_index()
     grp = grp.sort_values('sales', ascending=False).reset_index(drop=True)
     return grp
 
@@ -94,8 +219,13 @@ def summarize_by_month(df, date_col='date'):
     Agrupa por ano-mês (YYYY-MM) e soma vendas.
     Retorna DataFrame com coluna 'month' (datetime de primeiro dia do mês) e 'sales'.
     """
-    df['month'] = pd.to_datetime(df[date_col]).dt.to_period('M').dt.to_timestamp()
-    grp = df.groupby('month')['sales'].sum().reset_index().sort_values('month')
+    # read_sales_excel já entrega a data como datetime; só converte se preciso
+    col = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(col):
+        col = pd.to_datetime(col)
+    # dois casts vetorizados em C; to_period('M') alocaria um Period por linha
+    df['month'] = col.values.astype('datetime64[M]').astype('datetime64[ns]')
+    grp = df.groupby('month', sort=False)['sales'].sum().reset_index().sort_values('month')
     return grp
 
 # -----------------------------
@@ -107,17 +237,28 @@ def plot_top_products(df_products, top_n=10):
     Gera um gráfico de barras dos top N produtos por vendas.
     Retorna objeto BytesIO com PNG.
     """
-    top = df_products.head(top_n).iloc[::-1]  # reverte para barras horizontais do menor para o maior
-    fig, ax = plt.subplots(figsize=(8, max(3, 0.5 * len(top))))
-    ax.barh(top['product'], top['sales'], color='#7c5cff', alpha=0.9)
-    ax.set_title(f'Top {min(top_n, len(top))} Produtos por Vendas')
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    # fatia os arrays antes de entrar no matplotlib, sem materializar um
+    # DataFrame intermediário; [::-1] reverte para barras do menor ao maior
+    prods = df_products['product'].to_numpy()[:top_n][::-1]
+    sales = df_products['sales'].to_numpy()[:top_n][::-1]
+    # API orientada a objetos: evita o gerenciador de figuras do pyplot
+    # (e o plt.close obrigatório) em renderização puramente offscreen
+    fig = Figure(figsize=(8, max(3, 0.5 * len(prods))), dpi=150)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.barh(prods, sales, color='#7c5cff', alpha=0.9)
+    ax.set_title(f'Top {len(prods)} Produtos por Vendas')
     ax.set_xlabel('Vendas (unidade monetária)')
     ax.grid(axis='x', linestyle='--', alpha=0.3)
-    plt.tight_layout()
+    fig.tight_layout()
 
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150)
-    plt.close(fig)
+    # compress_level=1 evita a autosseleção de filtros do libpng, que domina
+    # o tempo de encode; o PNG fica um pouco maior mas sai bem mais rápido
+    canvas.print_png(buf, pil_kwargs={'compress_level': 1})
     buf.seek(0)
     return buf
 
@@ -126,18 +267,24 @@ def plot_monthly_sales(df_monthly):
     Gera um gráfico de linhas (ou barras) com vendas por mês.
     Retorna objeto BytesIO com PNG.
     """
-    fig, ax = plt.subplots(figsize=(10, 4))
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(10, 4), dpi=150)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
     ax.plot(df_monthly['month'], df_monthly['sales'], marker='o', color='#00aaff')
     ax.set_title('Vendas por Mês')
     ax.set_ylabel('Vendas')
     ax.set_xlabel('Mês')
     ax.grid(alpha=0.25)
     fig.autofmt_xdate(rotation=45)
-    plt.tight_layout()
+    fig.tight_layout()
 
     buf = io.BytesIO()
-    fig.savefig(buf, format='png', dpi=150)
-    plt.close(fig)
+    # compress_level=1 evita a autosseleção de filtros do libpng, que domina
+    # o tempo de encode; o PNG fica um pouco maior mas sai bem mais rápido
+    canvas.print_png(buf, pil_kwargs={'compress_level': 1})
     buf.seek(0)
     return buf
 
@@ -145,74 +292,100 @@ def plot_monthly_sales(df_monthly):
 # Função para gerar PDF
 # -----------------------------
 
-def create_pdf_report(output_path, df_products, df_monthly, charts_buffers, metadata=None):
+@functools.lru_cache(maxsize=None)
+def _table_style():
+    """
+    Constrói uma única vez o TableStyle compartilhado pelas duas tabelas
+    do relatório (parse do HexColor e compilação das regras são pagos só
+    na primeira chamada). Import local para manter o reportlab lazy.
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f0f0')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+        ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ])
+
+def create_pdf_report(output_path, products, product_sales, month_labels, month_sales,
+                      charts_buffers, metadata=None):
     """
     Monta o PDF usando reportlab.platypus.
+    Recebe arrays simples (produtos, vendas por produto, rótulos YYYY-MM e
+    vendas por mês) para não arrastar DataFrames pelo caminho de montagem.
     charts_buffers: dict com {'top_products': BytesIO, 'monthly': BytesIO}
     metadata: dict opcional com informações (autor, título)
     """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import mm
+    from reportlab.platypus import (
+        SimpleDocTemplate,
+        Paragraph,
+        Preformatted,
+        Spacer,
+        Image,
+        Table,
+    )
+    from reportlab.lib.styles import getSampleStyleSheet
+
     doc = SimpleDocTemplate(output_path, pagesize=A4, rightMargin=20*mm, leftMargin=20*mm, topMargin=20*mm, bottomMargin=20*mm)
     styles = getSampleStyleSheet()
     story = []
 
-    # Título
+    # Título — os estilos Title/Heading* já usam fonte bold; embrulhar em
+    # <b> só obrigava o mini-parser XML do Paragraph a trabalhar à toa
     title = metadata.get('title') if metadata and 'title' in metadata else 'Relatório de Vendas'
-    story.append(Paragraph(f'<b>{title}</b>', styles['Title']))
+    story.append(Paragraph(title, styles['Title']))
     subtitle_text = metadata.get('subtitle', f'Gerado em {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
-    story.append(Paragraph(subtitle_text, styles['Normal']))
+    # texto puro, sem marcação: Preformatted pula o parse de XML
+    story.append(Preformatted(subtitle_text, styles['Normal']))
     story.append(Spacer(1, 8))
 
     # Sumário rápido
-    total_sales = df_products['sales'].sum()
-    total_products = len(df_products)
-    story.append(Paragraph(f'<b>Resumo rápido</b>', styles['Heading2']))
+    total_sales = product_sales.sum()
+    total_products = len(products)
+    story.append(Paragraph('Resumo rápido', styles['Heading2']))
     story.append(Paragraph(f'Total de vendas: <b>{total_sales:,.2f}</b>', styles['Normal']))
     story.append(Paragraph(f'Produtos distintos: <b>{total_products}</b>', styles['Normal']))
     story.append(Spacer(1, 10))
 
     # Inserir gráfico de top produtos
-    story.append(Paragraph('<b>Top produtos</b>', styles['Heading2']))
+    story.append(Paragraph('Top produtos', styles['Heading2']))
     img_top = Image(charts_buffers['top_products'], width=160*mm, height=90*mm)
     story.append(img_top)
     story.append(Spacer(1, 8))
 
     # Tabela: top produtos (mostra top 20)
-    story.append(Paragraph('<b>Vendas por produto (Top 20)</b>', styles['Heading3']))
-    top20 = df_products.head(20)
-    table_data = [['Produto', 'Vendas']]
-    for _, row in top20.iterrows():
-        table_data.append([row['product'], f"{row['sales']:,.2f}"])
-    tbl = Table(table_data, colWidths=[110*mm, 40*mm])
-    tbl.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#f0f0f0')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.black),
-        ('ALIGN', (1,1), (-1,-1), 'RIGHT'),
-        ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-    ]))
+    story.append(Paragraph('Vendas por produto (Top 20)', styles['Heading3']))
+    # itera sobre os arrays numpy; iterrows alocaria uma Series por linha
+    table_data = [['Produto', 'Vendas']] + [
+        [p, f"{s:,.2f}"]
+        for p, s in zip(products[:20], product_sales[:20])
+    ]
+    # estilo e larguras compartilhados pelas duas tabelas
+    table_style = _table_style()
+    col_widths = [110*mm, 40*mm]
+    tbl = Table(table_data, colWidths=col_widths)
+    tbl.setStyle(table_style)
     story.append(tbl)
     story.append(Spacer(1, 12))
 
     # Inserir gráfico mensal
-    story.append(Paragraph('<b>Vendas por mês</b>', styles['Heading2']))
+    story.append(Paragraph('Vendas por mês', styles['Heading2']))
     img_month = Image(charts_buffers['monthly'], width=160*mm, height=70*mm)
     story.append(img_month)
     story.append(Spacer(1, 12))
 
     # Tabela: vendas por mês
-    story.append(Paragraph('<b>Vendas por mês</b>', styles['Heading3']))
-    table_data = [['Mês', 'Vendas']]
-    for _, row in df_monthly.iterrows():
-        month_label = pd.to_datetime(row['month']).strftime('%Y-%m')
-        table_data.append([month_label, f"{row['sales']:,.2f}"])
-    tbl2 = Table(table_data, colWidths=[110*mm, 40*mm])
-    tbl2.setStyle(TableStyle([
-        ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#f0f0f0')),
-        ('TEXTCOLOR', (0,0), (-1,0), colors.black),
-        ('ALIGN', (1,1), (-1,-1), 'RIGHT'),
-        ('GRID', (0,0), (-1,-1), 0.25, colors.grey),
-        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-    ]))
+    story.append(Paragraph('Vendas por mês', styles['Heading3']))
+    table_data = [['Mês', 'Vendas']] + [
+        [label, f"{s:,.2f}"]
+        for label, s in zip(month_labels, month_sales)
+    ]
+    tbl2 = Table(table_data, colWidths=col_widths)
+    tbl2.setStyle(table_style)
     story.append(tbl2)
 
     # Constrói o PDF
@@ -222,19 +395,16 @@ def create_pdf_report(output_path, df_products, df_monthly, charts_buffers, meta
 # Fluxo principal
 # -----------------------------
 
-def main(argv):
-    if len(argv) < 3:
-        print("Uso: python sales_report.py caminho/para/vendas.xlsx caminho/para/relatorio.pdf")
-        sys.exit(1)
-    excel_path = argv[1]
-    pdf_path = argv[2]
-
+def process_one(excel_path, pdf_path):
+    """
+    Executa o fluxo completo (ler Excel → resumir → plotar → PDF)
+    para um único arquivo. Retorna o caminho do PDF gerado.
+    """
     # 1) Ler Excel
     df = read_sales_excel(excel_path)
 
-    # 2) Gerar resumos
-    df_products = summarize_by_product(df)
-    df_monthly = summarize_by_month(df)
+    # 2) Gerar resumos (um único groupby cobre os dois)
+    df_products, df_monthly = summarize_sales(df)
 
     # 3) Gerar gráficos (em memória)
     buf_top = plot_top_products(df_products, top_n=10)
@@ -245,11 +415,49 @@ def main(argv):
         'monthly': buf_month,
     }
 
-    # 4) Criar PDF
+    # 4) Criar PDF — converte os resumos para arrays uma única vez; a partir
+    # daqui a montagem do PDF não toca mais em pandas
+    products = df_products['product'].to_numpy()
+    product_sales = df_products['sales'].to_numpy()
+    # formata todos os rótulos de mês numa única chamada vetorizada
+    month_labels = df_monthly['month'].dt.strftime('%Y-%m').to_numpy()
+    month_sales = df_monthly['sales'].to_numpy()
     metadata = {'title': 'Relatório de Vendas', 'subtitle': f'Fonte: {excel_path}'}
-    create_pdf_report(pdf_path, df_products, df_monthly, charts, metadata=metadata)
+    create_pdf_report(pdf_path, products, product_sales, month_labels, month_sales,
+                      charts, metadata=metadata)
 
     print(f"Relatório gerado: {pdf_path}")
+    return pdf_path
+
+def main_batch(excel_dir, output_dir):
+    """
+    Processa todos os .xlsx de excel_dir em paralelo, um processo por
+    arquivo. Cada worker tem seu próprio parser e canvas, então os
+    arquivos escalam com os núcleos disponíveis sem disputar o GIL.
+    """
+    excel_paths = sorted(glob.glob(os.path.join(excel_dir, '*.xlsx')))
+    if not excel_paths:
+        print(f"Nenhum arquivo .xlsx encontrado em {excel_dir}")
+        sys.exit(1)
+    os.makedirs(output_dir, exist_ok=True)
+    pdf_paths = [
+        os.path.join(output_dir, os.path.splitext(os.path.basename(p))[0] + '.pdf')
+        for p in excel_paths
+    ]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # list() propaga exceções dos workers
+        list(executor.map(process_one, excel_paths, pdf_paths))
+
+def main(argv):
+    if len(argv) < 3:
+        print("Uso: python sales_report.py caminho/para/vendas.xlsx caminho/para/relatorio.pdf")
+        print("     python sales_report.py diretorio/com/planilhas/ diretorio/de/saida/")
+        sys.exit(1)
+
+    if os.path.isdir(argv[1]):
+        main_batch(argv[1], argv[2])
+    else:
+        process_one(argv[1], argv[2])
 
 if __name__ == '__main__':
     main(sys.argv)
\ No newline at end of file